@@ -1 +1,4 @@
 from .interpreter import Interpreter, InterpreterError
+from .metrics import Metrics
+from .profiling import Profiler
+from .catalog import BankCatalog
\ No newline at end of file
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from .base import Node
 
 @dataclass
@@ -39,4 +39,15 @@ class Done(Node):
     pass
 
 class Help(Node):
-    pass
\ No newline at end of file
+    pass
+
+class Banks(Node):
+    pass
+
+class Stats(Node):
+    pass
+
+@dataclass
+class Profile(Node):
+    action: Optional[str] = None
+    threshold_ms: Optional[int] = None
\ No newline at end of file
@@ -34,5 +34,16 @@ class Edit(Node):
 class Help(Node):
     pass
 
+class Banks(Node):
+    pass
+
+class Stats(Node):
+    pass
+
+@dataclass
+class Profile(Node):
+    action: Optional[str] = None
+    threshold_ms: Optional[int] = None
+
 class Quit(Node):
     pass
\ No newline at end of file
@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+INDEX_NAME = ".catalog.json"
+INDEX_VERSION = 1
+
+
+def detect_mode(first_line):
+    if "|" in first_line:
+        if first_line.lower().startswith("word |"):
+            return "categories"
+        return "hints"
+    return "letters"
+
+
+def describe_bank(path):
+    """Read a word bank file and return its catalog entry."""
+    st = os.stat(path)
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+    entry = {"mode": "letters", "categories": [], "rows": 0, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if not lines:
+        return entry
+    mode = detect_mode(lines[0])
+    entry["mode"] = mode
+    if mode == "categories":
+        entry["categories"] = [h.strip() for h in lines[0].split("|")][1:]
+        entry["rows"] = sum(1 for line in lines[1:] if line.split("|")[0].strip())
+    else:
+        entry["rows"] = len(lines)
+    return entry
+
+
+class BankCatalog:
+    """Index of the word banks in a folder, persisted next to them.
+
+    Entries are keyed by filename and re-read only when a file's size or
+    mtime changes; stale entries are parsed on a thread pool.
+    """
+
+    def __init__(self, folder="WordBanks", metrics=None, max_workers=None):
+        self.folder = folder
+        self.index_path = os.path.join(folder, INDEX_NAME)
+        self.metrics = metrics
+        self.max_workers = max_workers
+        self.banks = None
+        self._lock = threading.Lock()
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("banks", {})
+
+    def _write_index(self):
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "banks": self.banks}, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # The index is only a cache; failing to persist it is not fatal.
+            pass
+
+    def refresh(self):
+        """Bring the index up to date with the folder and return it."""
+        with self._lock:
+            if self.banks is None:
+                self.banks = self._read_index()
+            scanned = {}
+            try:
+                entries = list(os.scandir(self.folder))
+            except FileNotFoundError:
+                entries = []
+            for e in entries:
+                if e.name.startswith("."):
+                    continue
+                try:
+                    if e.is_file():
+                        scanned[e.name] = e.stat()
+                except FileNotFoundError:
+                    # Deleted between the scan and the stat.
+                    continue
+
+            changed = False
+            for name in list(self.banks):
+                if name not in scanned:
+                    del self.banks[name]
+                    changed = True
+
+            stale = []
+            for name, st in scanned.items():
+                entry = self.banks.get(name)
+                if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                    if self.metrics is not None:
+                        self.metrics.incr("cache_hits", cache="catalog")
+                else:
+                    stale.append(name)
+
+            if stale:
+                paths = [os.path.join(self.folder, name) for name in stale]
+                if len(stale) == 1:
+                    results = [self._describe(paths[0])]
+                else:
+                    with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                        results = list(pool.map(self._describe, paths))
+                for name, entry in zip(stale, results):
+                    if entry is None:
+                        self.banks.pop(name, None)
+                    elif entry == "unreadable":
+                        # Keep size and mtime so the file is only retried once it changes.
+                        st = scanned[name]
+                        self.banks[name] = {
+                            "mode": "unreadable", "categories": [], "rows": 0,
+                            "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                        }
+                    else:
+                        self.banks[name] = entry
+                changed = True
+
+            if changed:
+                self._write_index()
+            return dict(self.banks)
+
+    def _describe(self, path):
+        try:
+            return describe_bank(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError):
+            return "unreadable"
+
+    def list(self):
+        """Return catalog entries as a list of dicts sorted by bank name."""
+        return [dict(entry, name=name) for name, entry in sorted(self.refresh().items())]
@@ -1,15 +1,19 @@
 import os
 import random
 import json
-from .lexer import Lexer
+import time
+from .lexer import Lexer, LexerError
 from .parser import Parser, ParserError
+from .metrics import Metrics
+from .profiling import Profiler
+from .catalog import BankCatalog, detect_mode
 from .ast_nodes import play, edit
 
 class InterpreterError(Exception):
     pass
 
 class Interpreter:
-    def __init__(self):
+    def __init__(self, metrics=None, profiler=None, catalog=None):
         self.mode = "play"
         self.file_mode = "letters"
         self.words = []
@@ -22,21 +26,49 @@ class Interpreter:
         self.current_file = None
         self.current_filename = None
         self.hint_index = 0
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.catalog = catalog if catalog is not None else BankCatalog(metrics=self.metrics)
+        self.last_command = ("play", "invalid")
 
     def run_once(self, code: str):
-        lexer = Lexer(code)
-        tokens = []
-        while True:
-            tok = lexer.next_token()
-            tokens.append(tok)
-            if tok.type.name == "EOF":
-                break
+        if self.profiler.enabled:
+            return self.profiler.call(self._run_once, code, lambda: self.last_command)
+        return self._run_once(code)
+
+    def _run_once(self, code: str):
+        metrics = self.metrics
+        mode = self.mode
+        command = "invalid"
+        start = time.perf_counter()
         try:
-            parser = Parser(tokens, self.mode)
-            node = parser.parse()
-            return self.eval(node)
-        except ParserError as e:
-            return f"Syntax Error: {e}"
+            with metrics.phase("lex"):
+                tokens = Lexer(code).tokens()
+            try:
+                with metrics.phase("parse"):
+                    parser = Parser(tokens, self.mode)
+                    node = parser.parse()
+            except ParserError as e:
+                metrics.incr("errors", kind="syntax")
+                return f"Syntax Error: {e}"
+            command = type(node).__name__.lower()
+            with metrics.phase("eval"):
+                result = self.eval(node)
+            if isinstance(result, str) and result.startswith("Error"):
+                metrics.incr("errors", kind="command")
+            return result
+        except LexerError:
+            metrics.incr("errors", kind="lexer")
+            raise
+        except InterpreterError:
+            metrics.incr("errors", kind="interpreter")
+            raise
+        except Exception:
+            metrics.incr("errors", kind="exception")
+            raise
+        finally:
+            self.last_command = (mode, command)
+            metrics.observe_command(mode, command, time.perf_counter() - start)
 
     def eval(self, node):
         if isinstance(node, (play.Help, edit.Help)):
@@ -57,9 +89,11 @@ class Interpreter:
                 "guess <word>           - Submit your guess",
                 "show                   - Display the current secret word",
                 "words                  - List all words in the current word bank",
+                "banks                  - List all word banks with their mode and size",
                 "max_guesses <n>        - Set the maximum number of guesses",
                 "edit                   - Switch to edit mode",
                 "help                   - Show this help message",
+                "stats                  - Show timing and counter metrics",
                 "quit                   - Exit the game",
             ]
             return "\n".join(lines)
@@ -161,6 +195,15 @@ class Interpreter:
             self.mode = "edit"
             return "Switched to edit mode. Type 'help' for edit commands."
 
+        if isinstance(node, play.Banks):
+            return self._list_banks()
+
+        if isinstance(node, play.Stats):
+            return self.metrics.summary()
+
+        if isinstance(node, play.Profile):
+            return self._profile(node)
+
         if isinstance(node, play.Quit):
             raise SystemExit()
 
@@ -211,6 +254,7 @@ class Interpreter:
                 "create <filename>                            - Create a new word bank file",
                 "file <filename>                              - Load an existing word bank file",
                 "deletefile <filename>                        - Delete a word bank file",
+                "banks                                        - List all word banks with their mode and size",
                 "categories <cat1> | <cat2> | <cat3>          - Define categories (for categories mode)",
                 "add <word>                                   - Add a word (letters mode)",
                 "add <word> | <val1> | <val2> | <val3>        - Add a word with values or hints",
@@ -219,6 +263,7 @@ class Interpreter:
                 "delete <index>                               - Delete a word by its index",
                 "done                                         - Exit edit mode and return to play mode",
                 "help                                         - Show this help message",
+                "stats                                        - Show timing and counter metrics",
             ]
             return "\n".join(lines)
 
@@ -289,12 +334,40 @@ class Interpreter:
             self.words.pop(node.index - 1)
             return f"Deleted word '{removed[0]}'\n" + self._save_file()
 
+        if isinstance(node, edit.Banks):
+            return self._list_banks()
+
+        if isinstance(node, edit.Stats):
+            return self.metrics.summary()
+
+        if isinstance(node, edit.Profile):
+            return self._profile(node)
+
         if isinstance(node, edit.Done):
             self.mode = "play"
             return "Exiting edit mode, back to play mode."
 
         return f"Unknown edit command: {node}"
 
+    def _list_banks(self):
+        with self.metrics.phase("io"):
+            banks = self.catalog.list()
+        if not banks:
+            return "No word banks found."
+        lines = [f"{'name':<20}{'mode':<12}{'entries':>8}{'bytes':>9}  categories"]
+        lines.append("-" * len(lines[0]))
+        for bank in banks:
+            cats = " | ".join(bank["categories"])
+            lines.append(f"{bank['name']:<20}{bank['mode']:<12}{bank['rows']:>8}{bank['size']:>9}  {cats}".rstrip())
+        return "\n".join(lines)
+
+    def _profile(self, node):
+        if node.action is not None:
+            self.profiler.enabled = node.action == "on"
+        if node.threshold_ms is not None:
+            self.profiler.threshold_ms = node.threshold_ms
+        return self.profiler.status()
+
     def _create_file(self, filename):
         folder_path = os.path.join("WordBanks")
         os.makedirs(folder_path, exist_ok=True)
@@ -303,7 +376,7 @@ class Interpreter:
         
         if os.path.exists(filepath):
             return f"Error: file '{filename}' already exists"
-        with open(filepath, "w", encoding="utf-8") as f:
+        with self.metrics.phase("io"), open(filepath, "w", encoding="utf-8") as f:
             pass
         self.current_file = filepath
         self.current_filename = filename
@@ -318,22 +391,16 @@ class Interpreter:
         
         if not os.path.exists(filepath):
             return f"Error: file '{filename}' not found"
-        with open(filepath, "r", encoding="utf-8") as f:
+        with self.metrics.phase("io"), open(filepath, "r", encoding="utf-8") as f:
             lines = [line.strip() for line in f if line.strip()]
+        self.metrics.incr("bank_loads")
         if not lines:
             self.words, self.word_data, self.categories = [], [], []
             self.current_file = filepath
             self.current_filename = filename
             self.file_mode = "letters"
             return f"Loaded file '{filename}' (empty)"
-        first_line = lines[0]
-        if "|" in first_line:
-            if first_line.lower().startswith("word |"):
-                file_mode = "categories"
-            else:
-                file_mode = "hints"
-        else:
-            file_mode = "letters"
+        file_mode = detect_mode(lines[0])
         self.words, self.word_data, self.categories = [], [], []
         self.current_file = filepath
         self.current_filename = filename
@@ -362,7 +429,7 @@ class Interpreter:
     def _save_file(self):
         if not self.current_file:
             return "Error: no file selected"
-        with open(self.current_file, "w", encoding="utf-8") as f:
+        with self.metrics.phase("io"), open(self.current_file, "w", encoding="utf-8") as f:
             if self.file_mode == "categories":
                 if self.categories:
                     f.write("word | " + " | ".join(self.categories) + "\n")
@@ -382,7 +449,8 @@ class Interpreter:
         
         if not os.path.exists(filepath):
             return f"Error: file '{filename}' does not exist"
-        os.remove(filepath)
+        with self.metrics.phase("io"):
+            os.remove(filepath)
         if self.current_file == filename:
             self.current_file, self.words, self.word_data, self.categories = None, [], [], []
         return f"Deleted file '{filename}'"
\ No newline at end of file
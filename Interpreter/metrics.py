@@ -0,0 +1,171 @@
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# Upper bounds (in seconds) of the latency histogram buckets.
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+PHASES = ("lex", "parse", "eval", "io")
+
+_NOOP = nullcontext()
+
+
+def _env_enabled():
+    return os.environ.get("LEXIS_METRICS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.n = 0
+
+    def observe(self, seconds):
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += seconds
+        self.n += 1
+
+    def cumulative(self):
+        running = 0
+        out = []
+        for bound, count in zip(BUCKETS + (float("inf"),), self.counts):
+            running += count
+            out.append((bound, running))
+        return out
+
+    def mean(self):
+        return self.total / self.n if self.n else 0.0
+
+
+class _Timer:
+    def __init__(self, metrics, phase):
+        self.metrics = metrics
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe_phase(self.phase, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """Phase timings, per-command latency histograms and counters.
+
+    Disabled instances turn every call into a cheap no-op, so the
+    interpreter can always be instrumented.
+    """
+
+    def __init__(self, enabled=None):
+        self.enabled = _env_enabled() if enabled is None else enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.phases = {phase: Histogram() for phase in PHASES}
+            self.commands = {}
+            self.counters = {"errors": {}, "cache_hits": {}, "bank_loads": {}}
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NOOP
+        return _Timer(self, name)
+
+    def observe_phase(self, name, seconds):
+        with self._lock:
+            self.phases.setdefault(name, Histogram()).observe(seconds)
+
+    def observe_command(self, mode, command, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            key = (mode, command)
+            hist = self.commands.get(key)
+            if hist is None:
+                hist = self.commands[key] = Histogram()
+            hist.observe(seconds)
+
+    def incr(self, name, amount=1, **labels):
+        if not self.enabled:
+            return
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def summary(self):
+        if not self.enabled:
+            return "Metrics are disabled (set LEXIS_METRICS=1 to enable)."
+        with self._lock:
+            lines = ["\n=== Phase Timings ===", f"{'phase':<8}{'count':>8}{'mean ms':>10}{'total ms':>11}"]
+            for name, hist in self.phases.items():
+                lines.append(f"{name:<8}{hist.n:>8}{hist.mean() * 1000:>10.3f}{hist.total * 1000:>11.3f}")
+            lines.append("\n=== Command Latency ===")
+            lines.append(f"{'command':<20}{'count':>8}{'mean ms':>10}{'p95 ms':>10}")
+            for (mode, command), hist in sorted(self.commands.items()):
+                label = f"{mode}/{command}"
+                p95 = _quantile(hist, 0.95)
+                p95_text = f"<={p95 * 1000:.1f}" if p95 != float("inf") else ">2500"
+                lines.append(f"{label:<20}{hist.n:>8}{hist.mean() * 1000:>10.3f}{p95_text:>10}")
+            lines.append("\n=== Counters ===")
+            for name in sorted(self.counters):
+                series = self.counters[name]
+                total = sum(series.values())
+                detail = ", ".join(
+                    f"{'/'.join(v for _, v in key)}={n}" for key, n in sorted(series.items()) if key
+                )
+                lines.append(f"{name}: {total}" + (f" ({detail})" if detail else ""))
+        return "\n".join(lines)
+
+    def render_prometheus(self):
+        out = []
+        with self._lock:
+            out.append("# HELP lexis_phase_seconds Time spent in each interpreter phase (io is nested in eval).")
+            out.append("# TYPE lexis_phase_seconds histogram")
+            for name, hist in self.phases.items():
+                _render_histogram(out, "lexis_phase_seconds", {"phase": name}, hist)
+            out.append("# HELP lexis_command_seconds Latency of Interpreter.run_once per command.")
+            out.append("# TYPE lexis_command_seconds histogram")
+            for (mode, command), hist in sorted(self.commands.items()):
+                _render_histogram(out, "lexis_command_seconds", {"mode": mode, "command": command}, hist)
+            for name in sorted(self.counters):
+                metric = f"lexis_{name}_total"
+                out.append(f"# TYPE {metric} counter")
+                series = self.counters[name] or {(): 0}
+                for key, n in sorted(series.items()):
+                    out.append(f"{metric}{_labels(dict(key))} {n}")
+        return "\n".join(out) + "\n"
+
+
+def _quantile(hist, q):
+    if not hist.n:
+        return 0.0
+    target = q * hist.n
+    for bound, running in hist.cumulative():
+        if running >= target:
+            return bound
+    return float("inf")
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    body = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    return "{" + body + "}"
+
+
+def _render_histogram(out, metric, labels, hist):
+    for bound, running in hist.cumulative():
+        le = "+Inf" if bound == float("inf") else repr(bound)
+        out.append(f"{metric}_bucket{_labels(dict(labels, le=le))} {running}")
+    out.append(f"{metric}_sum{_labels(labels)} {hist.total}")
+    out.append(f"{metric}_count{_labels(labels)} {hist.n}")
@@ -21,6 +21,9 @@ class Parser:
             "show": lambda: play.Show(),
             "edit": lambda: play.Edit(),
             "help": lambda: play.Help(),
+            "banks": lambda: play.Banks(),
+            "stats": lambda: play.Stats(),
+            "profile": lambda: play.Profile(*self._parse_profile()),
             "quit": lambda: play.Quit(),
         }
 
@@ -35,6 +38,9 @@ class Parser:
             "delete": lambda: edit.Delete(int(self._expect(TokenType.INT).text)),
             "done": lambda: edit.Done(),
             "help": lambda: edit.Help(),
+            "banks": lambda: edit.Banks(),
+            "stats": lambda: edit.Stats(),
+            "profile": lambda: edit.Profile(*self._parse_profile()),
         }
 
     def _peek(self):
@@ -74,6 +80,17 @@ class Parser:
             return play.Word(self._advance().text)
         return play.Word()
 
+    def _parse_profile(self):
+        action = None
+        threshold_ms = None
+        if self._peek().type == TokenType.IDENT:
+            action = self._advance().text.lower()
+            if action not in ("on", "off"):
+                raise ParserError(f"Expected 'on' or 'off', got '{action}'")
+        if self._peek().type == TokenType.INT:
+            threshold_ms = int(self._advance().text)
+        return action, threshold_ms
+
     def _parse_categories(self):
         headers = []
         while True:
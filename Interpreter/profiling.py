@@ -0,0 +1,89 @@
+import cProfile
+import os
+import threading
+import time
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class Profiler:
+    """Opt-in cProfile wrapper around Interpreter.run_once.
+
+    Every command is profiled while enabled, but a pstats file is only
+    written when the command took at least ``threshold_ms`` or when it is
+    the ``sample_every``-th command. Files land in
+    ``<directory>/<mode>_<command>/`` and only the newest ``keep`` are
+    kept per command type. Load them with ``python -m pstats``, snakeviz
+    or flameprof.
+
+    Profiled commands run one at a time: on Python 3.12+ cProfile hooks
+    the whole process, so a concurrent command would leak its frames
+    into another command's file.
+    """
+
+    def __init__(self, enabled=None, threshold_ms=None, sample_every=None, directory=None, keep=None):
+        if enabled is None:
+            enabled = os.environ.get("LEXIS_PROFILE", "0").strip().lower() in ("1", "true", "yes", "on")
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms if threshold_ms is not None else _env_int("LEXIS_PROFILE_THRESHOLD_MS", 100)
+        self.sample_every = sample_every if sample_every is not None else _env_int("LEXIS_PROFILE_SAMPLE", 0)
+        self.directory = directory or os.environ.get("LEXIS_PROFILE_DIR", "profiles")
+        self.keep = max(1, keep if keep is not None else _env_int("LEXIS_PROFILE_KEEP", 20))
+        self.seen = 0
+        self.written = 0
+        self._lock = threading.Lock()
+        self._call_lock = threading.Lock()
+
+    def status(self):
+        state = "on" if self.enabled else "off"
+        sample = f", sampling 1 in {self.sample_every}" if self.sample_every > 0 else ""
+        return (
+            f"Profiling {state} (threshold {self.threshold_ms} ms{sample}, "
+            f"{self.written} profiles written to '{self.directory}')"
+        )
+
+    def call(self, func, code, label):
+        """Run ``func(code)`` under cProfile; ``label()`` names the command once it has run."""
+        with self._call_lock:
+            prof = cProfile.Profile()
+            try:
+                prof.enable()
+            except ValueError:
+                # Another profiler (e.g. an outer cProfile run) is already
+                # active; on Python 3.12+ that check is process-wide.
+                return func(code)
+            start = time.perf_counter()
+            try:
+                return func(code)
+            finally:
+                prof.disable()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self.seen += 1
+                    sampled = self.sample_every > 0 and self.seen % self.sample_every == 0
+                if elapsed_ms >= self.threshold_ms or sampled:
+                    self._dump(prof, label(), elapsed_ms)
+
+    def _dump(self, prof, label, elapsed_ms):
+        mode, command = label
+        folder = os.path.join(self.directory, f"{mode}_{command}")
+        try:
+            os.makedirs(folder, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{time.time_ns() % 1_000_000_000:09d}"
+            prof.dump_stats(os.path.join(folder, f"{stamp}_{elapsed_ms:.0f}ms.prof"))
+            with self._lock:
+                self.written += 1
+            self._rotate(folder)
+        except OSError:
+            # Profiling must never break the command it is observing.
+            pass
+
+    def _rotate(self, folder):
+        files = sorted(f for f in os.listdir(folder) if f.endswith(".prof"))
+        for name in files[:-self.keep]:
+            os.remove(os.path.join(folder, name))
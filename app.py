@@ -1,9 +1,31 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+import json
+import os
+import threading
+import time
 from Interpreter import Interpreter, InterpreterError
 
 app = Flask(__name__)
 interp = Interpreter()
 
+# Build or refresh the bank catalog in the background so the first
+# "banks" request does not pay for scanning WordBanks/.
+threading.Thread(target=interp.catalog.refresh, daemon=True).start()
+
+# Set LEXIS_RECORD=<path> to append every /run call to a JSON-lines log
+# that loadtest.py can replay.
+RECORD_PATH = os.environ.get("LEXIS_RECORD")
+record_lock = threading.Lock()
+
+def record(session, command, started, elapsed):
+    line = json.dumps({"t": round(started, 3), "s": session, "c": command, "ms": round(elapsed * 1000, 3)})
+    try:
+        with record_lock, open(RECORD_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        # Recording must never break the command it is observing.
+        pass
+
 @app.route("/run", methods=["POST"])
 def run():
     try:
@@ -12,7 +34,14 @@ def run():
         if not command:
             return jsonify({"status": "error", "message": "No command provided"}), 400
 
-        result = interp.run_once(command)
+        started = time.time()
+        start = time.perf_counter()
+        try:
+            result = interp.run_once(command)
+        finally:
+            if RECORD_PATH:
+                session = str(data.get("session") or request.remote_addr)
+                record(session, command, started, time.perf_counter() - start)
         return jsonify(result)
 
     except InterpreterError as e:
@@ -20,5 +49,16 @@ def run():
     except Exception as e:
         return jsonify({"status": "error", "message": f"Runtime error: {e}"}), 500
 
+@app.route("/banks", methods=["GET"])
+def banks():
+    try:
+        return jsonify(interp.catalog.list())
+    except Exception as e:
+        return jsonify({"status": "error", "message": f"Runtime error: {e}"}), 500
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    return Response(interp.metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     app.run(debug=True)
\ No newline at end of file
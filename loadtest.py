@@ -0,0 +1,208 @@
+"""Replay recorded or synthetic game traffic against the Lexis web API.
+
+Record real traffic by starting app.py with LEXIS_RECORD=<path>, then:
+
+    python loadtest.py replay traffic.jsonl --concurrency 8
+    python loadtest.py synthetic --bank snuzzle --sessions 200 --concurrency 8
+    python loadtest.py synthetic --bank snuzzle --url http://127.0.0.1:5000
+
+Without --url the requests go through Flask's test client in-process.
+The "errors" column counts transport failures, timeouts and HTTP errors.
+The "failed" column counts HTTP 200 replies whose body starts with
+"Error" or "Syntax Error". Those replies return early and are cheap, so
+a high count pulls the percentiles down.
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from Interpreter import Interpreter, Metrics
+
+
+def load_log(path):
+    """Group a recorded log into sessions of (offset, command) pairs."""
+    sessions = defaultdict(list)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            rec = json.loads(line)
+            sessions[rec["s"]].append((rec["t"], rec["c"]))
+    out = []
+    for name, entries in sessions.items():
+        entries.sort()
+        first = entries[0][0]
+        out.append((name, [(t - first, c) for t, c in entries]))
+    return out
+
+
+def synthetic_sessions(bank, count, seed=None):
+    """Build full game sessions: load, start, pick a word, guess until the guesses run out."""
+    interp = Interpreter(metrics=Metrics(enabled=False))
+    loaded = interp.run_once(f"file {bank}")
+    if not interp.words:
+        raise SystemExit(f"Cannot build sessions from '{bank}': {loaded}")
+    rng = random.Random(seed)
+    sessions = []
+    for n in range(count):
+        commands = [f"file {bank}", "start", "word"]
+        commands += [f"guess {rng.choice(interp.words)}" for _ in range(interp.max_guesses)]
+        commands.append("show")
+        sessions.append((f"synthetic-{n}", [(0.0, c) for c in commands]))
+    return sessions
+
+
+def is_failed_reply(body):
+    """True for interpreter failures that the API returns as HTTP 200."""
+    try:
+        reply = json.loads(body)
+    except (TypeError, ValueError):
+        return False
+    return isinstance(reply, str) and reply.startswith(("Error", "Syntax Error"))
+
+
+class HttpTarget:
+    def __init__(self, url, timeout):
+        self.url = url.rstrip("/") + "/run"
+        self.timeout = timeout
+
+    def __call__(self, session, command):
+        body = json.dumps({"command": command, "session": session}).encode("utf-8")
+        req = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                return resp.status, resp.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+
+class TestClientTarget:
+    def __init__(self):
+        from app import app
+        self.app = app
+        self.local = threading.local()
+
+    def __call__(self, session, command):
+        client = getattr(self.local, "client", None)
+        if client is None:
+            client = self.local.client = self.app.test_client()
+        try:
+            resp = client.post("/run", json={"command": command, "session": session})
+        except SystemExit:
+            # A replayed 'quit' escapes the app in-process; over HTTP the
+            # server turns it into an error response instead.
+            return 500, None
+        return resp.status_code, resp.get_data()
+
+
+def run_session(target, session, entries, pace, results, lock):
+    start = time.perf_counter()
+    for offset, command in entries:
+        if pace:
+            delay = offset / pace - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+        t0 = time.perf_counter()
+        try:
+            status, body = target(session, command)
+        except Exception:
+            # Connection errors and timeouts.
+            status, body = None, None
+        elapsed = time.perf_counter() - t0
+        kind = command.split()[0].lower() if command.split() else "invalid"
+        failed = status == 200 and is_failed_reply(body)
+        with lock:
+            results.append((kind, elapsed, status, failed))
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+def report(results, wall):
+    by_kind = defaultdict(list)
+    errors = defaultdict(int)
+    failures = defaultdict(int)
+    for kind, elapsed, status, failed in results:
+        by_kind[kind].append(elapsed)
+        by_kind["ALL"].append(elapsed)
+        if status is None or status >= 400:
+            errors[kind] += 1
+            errors["ALL"] += 1
+        elif failed:
+            failures[kind] += 1
+            failures["ALL"] += 1
+    lines = [
+        f"{len(results)} requests in {wall:.2f}s ({len(results) / wall if wall else 0:.1f} req/s)",
+        f"{'command':<14}{'count':>8}{'errors':>8}{'failed':>8}{'req/s':>9}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}",
+    ]
+    for kind in sorted(by_kind, key=lambda k: (k == "ALL", k)):
+        values = sorted(by_kind[kind])
+        p50, p95, p99 = (percentile(values, q) * 1000 for q in (0.50, 0.95, 0.99))
+        rate = len(values) / wall if wall else 0
+        lines.append(
+            f"{kind:<14}{len(values):>8}{errors[kind]:>8}{failures[kind]:>8}{rate:>9.1f}"
+            f"{p50:>10.3f}{p95:>10.3f}{p99:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def run(sessions, target, concurrency, pace):
+    results = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            pool.submit(run_session, target, name, entries, pace, results, lock)
+            for name, entries in sessions
+        ]
+        for future in futures:
+            future.result()
+    return results, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the Lexis web API.")
+    sub = parser.add_subparsers(dest="source", required=True)
+    replay = sub.add_parser("replay", help="Replay a log recorded with LEXIS_RECORD")
+    replay.add_argument("log")
+    replay.add_argument("--pace", type=float, default=0.0,
+                        help="Honour recorded gaps within a session at this speed-up (0 = as fast as possible)")
+    synth = sub.add_parser("synthetic", help="Generate full game sessions from a word bank")
+    synth.add_argument("--bank", required=True)
+    synth.add_argument("--sessions", type=int, default=100)
+    synth.add_argument("--seed", type=int)
+    for p in (replay, synth):
+        p.add_argument("--concurrency", type=int, default=4)
+        p.add_argument("--url", help="Server base URL, e.g. http://127.0.0.1:5000 (default: Flask test client)")
+        p.add_argument("--timeout", type=float, default=10.0,
+                       help="Per-request timeout in seconds for --url; timeouts count as errors")
+    args = parser.parse_args(argv)
+
+    if args.source == "replay":
+        sessions = load_log(args.log)
+        pace = args.pace
+    else:
+        sessions = synthetic_sessions(args.bank, args.sessions, args.seed)
+        pace = 0.0
+    target = HttpTarget(args.url, args.timeout) if args.url else TestClientTarget()
+
+    results, wall = run(sessions, target, args.concurrency, pace)
+    print(report(results, wall))
+
+
+if __name__ == "__main__":
+    sys.exit(main())